@@ -2,12 +2,19 @@ from abc import ABC, abstractmethod
 import meyendtris
 from direct.gui.OnscreenText import OnscreenText
 from direct.gui.OnscreenImage import OnscreenImage
+from direct.gui.OnscreenGeom import OnscreenGeom
 from direct.showbase.ShowBase import ShowBase
 from direct.showbase.Audio3DManager import Audio3DManager
 import panda3d.core as pandac
 import meyendtris.framework.eventmarkers.eventmarkers
 from meyendtris.framework.latentmodule import LatentModule
 import math, warnings, os
+
+_ALEFT = pandac.TextNode.ALeft
+_ARIGHT = pandac.TextNode.ARight
+_ACENTER = pandac.TextNode.ACenter
+_ALIGN = {'left':_ALEFT, 'right':_ARIGHT, 'center':_ACENTER}  # write() alignment names
+_MALPHA = pandac.TransparencyAttrib.MAlpha
     
 class BasicStimuli(LatentModule, ABC):
     """
@@ -22,18 +29,36 @@ class BasicStimuli(LatentModule, ABC):
 
     class destroy_helper:
         """Small helper class to destroy multiple objects using a destroy() call."""
+        __slots__ = ('objs',)
         def __init__(self,objs):
             self.objs = objs
         def destroy(self):
             for o in self.objs:
                 o.destroy()
 
+    _font_cache = {}    # fonts loaded by write(), keyed by font path
+    _blank_tex = None   # shared 1x1 texture for crosshair() and rectangle()
+    _image_pool = []    # released OnscreenImage nodes, ready for reuse by _acquire_image()
+    _text_pool = []     # released OnscreenText nodes, ready for reuse by _acquire_text()
+    _destroy_dispatch = {}  # stimulus type -> function that tears down an object of that type
+    _shared_audio3d = None  # Audio3DManager shared by all modules, created by the first surround sound()
+    _sfx_cache = {}     # sound handles from precache_sound()/precache_movie(), keyed by file name
+    _tex_cache = {}     # texture handles from precache_picture()/precache_movie(), keyed by file name
+    _model_cache = {}   # model handles from precache_model(), keyed by file name
+    _has_audio = {}     # whether a movie file has a sound track, keyed by file name
+
     def __init__(self):
         self._base = meyendtris.__BASE__
         super().__init__(make_up_for_lost_time = False)
-        self.audio3d = None
         self.implicit_markers = False
-        self._to_destroy = []
+        self._to_destroy = {}
+        if BasicStimuli._blank_tex is None:
+            BasicStimuli._blank_tex = self._base.loader.loadTexture(meyendtris.path_join('media/blank.tga'))
+
+    @property
+    def audio3d(self):
+        """The shared Audio3DManager used for surround sound (None until first needed)."""
+        return BasicStimuli._shared_audio3d
 
     def marker(self,markercode):
         """
@@ -67,35 +92,26 @@ class BasicStimuli(LatentModule, ABC):
               ):
         """Write a piece of text on the screen and keep it there for a particular duration."""
         
-        if align == 'left':
-            align = pandac.TextNode.ALeft
-        elif align == 'right':
-            align = pandac.TextNode.ARight
-        else:
-            align = pandac.TextNode.ACenter
+        align = _ALIGN.get(align, _ACENTER)
         if duration == 0:
             block = False
         
 
-        font = self._base.loader.loadFont(font)
-        obj = OnscreenText(text=text,pos=(pos[0],pos[1]-scale/4),roll=roll,scale=scale,fg=fg,bg=bg,shadow=shadow,shadowOffset=shadow_offset,frame=frame,align=align,wordwrap=wordwrap,drawOrder=draw_order,font=font,parent=parent,sort=sort)
-        self._to_destroy.append(obj)
+        f = BasicStimuli._font_cache.get(font)
+        if f is None:
+            f = self._base.loader.loadFont(font)
+            BasicStimuli._font_cache[font] = f
+        font = f
+        obj = self._acquire_text(text,(pos[0],pos[1]-scale/4),roll,scale,fg,bg,shadow,shadow_offset,frame,align,wordwrap,draw_order,font,parent,sort)
+        self._to_destroy[id(obj)] = obj
         if self.implicit_markers:
             self.marker(254)
         if block:
-            if type(duration) == list or type(duration) == tuple:
-                self.sleep(duration[0])
-                self.waitfor(duration[1])
-            elif type(duration) == str:
-                self.waitfor(duration)
-            else:
-                self.sleep(duration)
-                
-            self._destroy_object(obj,255)
+            self._block_for(duration,obj,255)
         else:
             if duration > 0:
-                self._base.taskMgr.doMethodLater(duration, self._destroy_object, 'ConvenienceFunctions, remove_text', extraArgs=[obj, 255])
-            return obj
+                self._schedule_destroy(obj,duration,255,block=False,name='ConvenienceFunctions, remove_text')
+            return self._hand_out(obj)
 
     def crosshair(self,
                   duration=1.0,     # duration for which this object will be displayed
@@ -111,28 +127,19 @@ class BasicStimuli(LatentModule, ABC):
                   parent=None       # the renderer to use for displaying the object
                   ):        
         """Draw a crosshair."""
-        img = meyendtris.path_join('media/blank.tga')
-        obj1 = OnscreenImage(image=img,pos=(pos[0],0,pos[1]),scale=(size,1,width),color=color,parent=parent)
-        self._to_destroy.append(obj1)
-        obj1.setTransparency(pandac.TransparencyAttrib.MAlpha)
-        obj2 = OnscreenImage(image=img,pos=(pos[0],0,pos[1]),scale=(width,1,size),color=color,parent=parent)
-        self._to_destroy.append(obj2)
-        obj2.setTransparency(pandac.TransparencyAttrib.MAlpha)
+        img = self._blank_tex
+        obj1 = self._acquire_image(img,pos=(pos[0],0,pos[1]),scale=(size,1,width),color=color,parent=parent)
+        self._to_destroy[id(obj1)] = obj1
+        obj2 = self._acquire_image(img,pos=(pos[0],0,pos[1]),scale=(width,1,size),color=color,parent=parent)
+        self._to_destroy[id(obj2)] = obj2
         if self.implicit_markers:
             self.marker(252)
         if block:
-            if type(duration) == list or type(duration) == tuple:
-                self.sleep(duration[0])
-                self.waitfor(duration[1])
-            elif type(duration) == str:
-                self.waitfor(duration)
-            else:
-                self.sleep(duration)
-            self._destroy_object([obj1,obj2],253)
+            self._block_for(duration,[obj1,obj2],253)
         else:
             if duration > 0:
-                self._base.taskMgr.doMethodLater(duration, self._destroy_object, 'ConvenienceFunctions, remove_crosshair',extraArgs=[[obj1,obj2],253])
-            return self.destroy_helper([obj1,obj2])
+                self._schedule_destroy([obj1,obj2],duration,253,block=False,name='ConvenienceFunctions, remove_crosshair')
+            return self.destroy_helper([self._hand_out(obj1),self._hand_out(obj2)])
   
     def rectangle(self,
                   rect=(0,0,0,0),        # the bounds of the rectangle (left,right,top,bottom)
@@ -152,24 +159,16 @@ class BasicStimuli(LatentModule, ABC):
             block = False
         
         l=rect[0];r=rect[1];t=rect[2];b=rect[3]
-        obj = OnscreenImage(image= meyendtris.path_join('media/blank.tga'),pos=((l+r)/2,depth,(b+t)/2),scale=((r-l)/2,1,(b-t)/2),color=color,parent=parent)
-        self._to_destroy.append(obj)
-        obj.setTransparency(pandac.TransparencyAttrib.MAlpha)
+        obj = self._acquire_image(self._blank_tex,pos=((l+r)/2,depth,(b+t)/2),scale=((r-l)/2,1,(b-t)/2),color=color,parent=parent)
+        self._to_destroy[id(obj)] = obj
         if self.implicit_markers:
             self.marker(250)
         if block:
-            if type(duration) == list or type(duration) == tuple:
-                self.sleep(duration[0])
-                self.waitfor(duration[1])
-            elif type(duration) == str:
-                self.waitfor(duration)
-            else:
-                self.sleep(duration)
-            self._destroy_object(obj,251)
+            self._block_for(duration,obj,251)
         else:
-            if duration > 0:                            
-                self._base.taskMgr.doMethodLater(duration, self._destroy_object, 'ConvenienceFunctions, remove_rect',extraArgs=[obj,251])
-            return obj
+            if duration > 0:
+                self._schedule_destroy(obj,duration,251,block=False,name='ConvenienceFunctions, remove_rect')
+            return self._hand_out(obj)
 
     def frame(self,
               rect=(0,0,0,0),            # the inner bounds of the frame (left,right,top,bottom)
@@ -187,34 +186,19 @@ class BasicStimuli(LatentModule, ABC):
                 
         l=rect[0];r=rect[1];t=rect[2];b=rect[3]
         w=thickness[0];h=thickness[1]
-        img = meyendtris.path_join('media/blank.tga')
-        L = OnscreenImage(image=img,pos=(l-w/2,0,(b+t)/2),scale=(w/2,1,w+(b-t)/2),color=color,parent=parent)
-        L.setTransparency(pandac.TransparencyAttrib.MAlpha)
-        self._to_destroy.append(L)
-        R = OnscreenImage(image=img,pos=(r+w/2,0,(b+t)/2),scale=(w/2,1,w+(b-t)/2),color=color,parent=parent)
-        R.setTransparency(pandac.TransparencyAttrib.MAlpha)
-        self._to_destroy.append(R)
-        T = OnscreenImage(image=img,pos=((l+r)/2,0,t-h/2),scale=(h+(r-l)/2,1,h/2),color=color,parent=parent)
-        T.setTransparency(pandac.TransparencyAttrib.MAlpha)
-        self._to_destroy.append(T)
-        B = OnscreenImage(image=img,pos=((l+r)/2,0,b+h/2),scale=(h+(r-l)/2,1,h/2),color=color,parent=parent)
-        B.setTransparency(pandac.TransparencyAttrib.MAlpha)
-        self._to_destroy.append(B)
+        cx=(l+r)/2;cz=(b+t)/2           # center of the frame
+        sx=h+(r-l)/2;sz=w+(b-t)/2       # half-lengths of the top/bottom and left/right bars
+        vw=w/2;vh=h/2                   # half-thickness of the bars
+        obj = OnscreenGeom(geom=self._quads_geom('frame',[(l-vw,cz,vw,sz),(r+vw,cz,vw,sz),(cx,t-vh,sx,vh),(cx,b+vh,sx,vh)],color),parent=parent)
+        self._to_destroy[id(obj)] = obj
         if self.implicit_markers:
             self.marker(242)
         if block:
-            if type(duration) == list or type(duration) == tuple:
-                self.sleep(duration[0])
-                self.waitfor(duration[1])
-            elif type(duration) == str:
-                self.waitfor(duration)
-            else:
-                self.sleep(duration)
-            self._destroy_object([L,R,T,B],243)
+            self._block_for(duration,obj,243)
         else:
             if duration > 0:
-                self._base.taskMgr.doMethodLater(duration,self._destroy_object, 'ConvenienceFunctions, remove_frame',extraArgs=[[L,R,T,B],243])    
-            return self.destroy_helper([L,R,T,B])        
+                self._schedule_destroy(obj,duration,243,block=False,name='ConvenienceFunctions, remove_frame')
+            return self.destroy_helper([obj])        
 
     def picture(self, 
               image,                    # the image to display (may be a file name, preferably a relative path)
@@ -232,33 +216,27 @@ class BasicStimuli(LatentModule, ABC):
               ):
         """Display a picture on the screen and keep it there for a particular duration."""        
         
-        if pos is not None and type(pos) not in (int,float) and len(pos) == 2:
+        if pos is not None and not isinstance(pos,(int,float)) and len(pos) == 2:
             pos = (pos[0],0,pos[1])
-        if scale is not None and type(scale) not in (int,float) and len(scale) == 2:
+        if scale is not None and not isinstance(scale,(int,float)) and len(scale) == 2:
             scale = (scale[0],1,scale[1])
-        if hpr is not None and type(scale) not in (int,float) and len(hpr) == 1:
+        if isinstance(hpr,(int,float)):
             hpr = (0,0,hpr)
+        elif hpr is not None and len(hpr) == 1:
+            hpr = (0,0,hpr[0])
         if duration == 0:
             block = False
             
-        obj = OnscreenImage(image=image,pos=pos,hpr=hpr,scale=scale,color=color,parent=parent)
-        self._to_destroy.append(obj)
-        obj.setTransparency(pandac.TransparencyAttrib.MAlpha)
+        obj = self._acquire_image(image,pos=pos,hpr=hpr,scale=scale,color=color,parent=parent)
+        self._to_destroy[id(obj)] = obj
         if self.implicit_markers:
             self.marker(248)
         if block:
-            if type(duration) == list or type(duration) == tuple:
-                self.sleep(duration[0])
-                self.waitfor(duration[1])
-            elif type(duration) == str:
-                self.waitfor(duration)
-            else:
-                self.sleep(duration)
-            self._destroy_object(obj,249)
+            self._block_for(duration,obj,249)
         else:
             if duration > 0:
-                self._base.taskMgr.doMethodLater(duration, self._destroy_object, 'ConvenienceFunctions, remove_picture', extraArgs=[obj,249])
-            return obj
+                self._schedule_destroy(obj,duration,249,block=False,name='ConvenienceFunctions, remove_picture')
+            return self._hand_out(obj)
 
     def sound(self,
               filename,         # the sound file name to play (preferably a relative path)
@@ -274,14 +252,15 @@ class BasicStimuli(LatentModule, ABC):
               ):
         """Play a sound in a particular location."""
         if surround:            
-            if self.audio3d is None:
-                self.audio3d = Audio3DManager(self._base.sfxManagerList[0], None)
-            obj = self.audio3d.loadSfx(filename)
-            self._to_destroy.append(obj)
-            self.audio3d.setSoundVelocityAuto(obj)
+            if BasicStimuli._shared_audio3d is None:
+                BasicStimuli._shared_audio3d = Audio3DManager(self._base.sfxManagerList[0], None)
+            audio3d = BasicStimuli._shared_audio3d
+            obj = audio3d.loadSfx(filename)
+            self._to_destroy[id(obj)] = obj
+            audio3d.setSoundVelocityAuto(obj)
         else:
             obj = self._base.loader.loadSfx(filename)
-            self._to_destroy.append(obj)
+            self._to_destroy[id(obj)] = obj
             obj.setVolume(volume)
             obj.setBalance(direction)
         length = obj.length()
@@ -300,10 +279,9 @@ class BasicStimuli(LatentModule, ABC):
         if self.implicit_markers:
             self.marker(246)
         if block:
-            self.sleep(length)
-            self._destroy_object(obj,247)            
+            self._schedule_destroy(obj,length,247)
         else:
-            self._base.taskMgr.doMethodLater(length, self._destroy_object, 'ConvenienceFunctions, end_sound', extraArgs=[None,247])
+            self._schedule_destroy(None,length,247,block=False,name='ConvenienceFunctions, end_sound')
             return obj
 
     def movie(self,
@@ -334,22 +312,25 @@ class BasicStimuli(LatentModule, ABC):
               ):
         """Play a movie. Note: Sound for movies only works with OpenAL (rather than FMOD) -- see documentation at http://www.panda3d.org/manual/index.php/Sound on how to select it."""
 
-        # load the sound track if there is one
-        try:
-            snd = self._base.loader.loadSfx(filename)
-            if snd.length() == 0.0:
+        # load the sound track if there is one (files known to have none are not probed again)
+        snd = None
+        if BasicStimuli._has_audio.get(filename, True):
+            try:
+                snd = self._base.loader.loadSfx(filename)
+                if snd.length() == 0.0:
+                    snd = None
+            except (OSError, AssertionError):
                 snd = None
-        except:
-            snd = None
+            BasicStimuli._has_audio[filename] = snd is not None
         # ... and set basic sound properties
         if snd is not None:
-            self._to_destroy.append(snd)
+            self._to_destroy[id(snd)] = snd
             snd.setVolume(volume)
             snd.setBalance(direction)
 
         # create the video texture and set basic properties
         tex = self._base.loader.loadTexture(filename)
-        self._to_destroy.append(tex)
+        self._to_destroy[id(tex)] = tex
         tex.setBorderColor((bordercolor[0],bordercolor[1],bordercolor[2],bordercolor[3]))
         tex.setWrapU(pandac.Texture.WMBorderColor)
         tex.setWrapV(pandac.Texture.WMBorderColor)
@@ -385,10 +366,12 @@ class BasicStimuli(LatentModule, ABC):
         # deduce the scale of the image
         if scale is None:
             scale = 1.0
-        if type(scale) in (int,float):
+        if isinstance(scale,(int,float)):
             scale = [scale,scale]
         if len(scale) == 2:
-            scale = (scale[0],1,scale[1])
+            scale = [scale[0],1,scale[1]]
+        else:
+            scale = list(scale)
         if pixelscale or parent == pixel2d:
             scale[0] *= tex.getVideoWidth()
             scale[2] *= tex.getVideoHeight()
@@ -399,66 +382,78 @@ class BasicStimuli(LatentModule, ABC):
                 scale[0] *= float(aspect)
             
         # deduce position and rotation
-        if pos is not None and type(pos) not in (int,float) and len(pos) == 2:
+        if pos is not None and not isinstance(pos,(int,float)) and len(pos) == 2:
             pos = (pos[0],0,pos[1])
-        if hpr is not None and type(scale) not in (int,float) and len(hpr) == 1:
+        if isinstance(hpr,(int,float)):
             hpr = (0,0,hpr)
+        elif hpr is not None and len(hpr) == 1:
+            hpr = (0,0,hpr[0])
         
         # create the image and set up content parameters
         img = OnscreenImage(image=tex,pos=pos,hpr=hpr,scale=scale,color=color,parent=parent)
-        self._to_destroy.append(img)
-        img.setTransparency(pandac.TransparencyAttrib.MAlpha)
-        img.setTexScale(pandac.TextureStage.getDefault(),contentscale[0],contentscale[1])
-        img.setTexOffset(pandac.TextureStage.getDefault(),contentoffset[0],contentoffset[1])
+        self._to_destroy[id(img)] = img
+        img.setTransparency(_MALPHA)
+        ts = pandac.TextureStage.getDefault()
+        img.setTexScale(ts,contentscale[0],contentscale[1])
+        img.setTexOffset(ts,contentoffset[0],contentoffset[1])
 
         # start playback and assure its destruction
         playable.play()
         if self.implicit_markers:
             self.marker(244)            
         if block:
-            self.sleep(length)
-            self._destroy_object(img, 245)
+            self._schedule_destroy(img,length,245)
         else:
-            self._base.taskMgr.doMethodLater(length, self._destroy_object, 'ConvenienceFunctions, remove_movie', extraArgs=[[img,tex,snd],245])
+            self._schedule_destroy([img,tex,snd],length,245,block=False,name='ConvenienceFunctions, remove_movie')
             return playable
 
     def precache_sound(self,filename):
         """Pre-cache a sound file."""
         if filename is None:
             return
-        return self._base.loader.loadSfx(filename)
+        h = self._base.loader.loadSfx(filename)
+        BasicStimuli._sfx_cache[filename] = h
+        return h
     
     def precache_picture(self,filename):
         """Pre-cache a picture file."""
         if filename is None:
             return
-        return self._base.loader.loadTexture(filename)
+        h = self._base.loader.loadTexture(filename)
+        BasicStimuli._tex_cache[filename] = h
+        return h
 
     def precache_model(self,filename):
         """Pre-cache a model file."""
         if filename is None:
             return
-        return self._base.loader.loadModel(filename)
+        h = self._base.loader.loadModel(filename)
+        BasicStimuli._model_cache[filename] = h
+        return h
     
     def precache_movie(self,filename):
         """Pre-cache a movie file."""
         if filename is None:
             return
         try:
-            self._base.loader.loadTexture(filename)
-        except:
+            BasicStimuli._tex_cache[filename] = self._base.loader.loadTexture(filename)
+        except (OSError, AssertionError):
             pass
         try:
-            return self._base.loader.loadSfx(filename)
-        except:
+            h = self._base.loader.loadSfx(filename)
+            BasicStimuli._sfx_cache[filename] = h
+            return h
+        except (OSError, AssertionError):
             pass
     
     def uncache_sound(self,filename):
         """Un-cache a previously cached sound file."""
         if filename is None:
             return
-        # get the handle
-        h = self._base.loader.loadSfx(filename)
+        # get the handle (only load it if it was not pre-cached through us)
+        h = BasicStimuli._sfx_cache.pop(filename,None)
+        if h is None:
+            h = self._base.loader.loadSfx(filename)
         # remove it
         self._base.loader.unloadSfx(h)
 
@@ -466,24 +461,38 @@ class BasicStimuli(LatentModule, ABC):
         """Un-cache a previously cached picture file."""
         if filename is None:
             return
-        # get the handle
-        h = self._base.loader.loadTexture(filename)
+        # get the handle (only load it if it was not pre-cached through us)
+        h = BasicStimuli._tex_cache.pop(filename,None)
+        if h is None:
+            h = self._base.loader.loadTexture(filename)
         # remove it
         self._base.loader.unloadTexture(h)
 
+    def uncache_model(self,filename):
+        """Un-cache a previously cached model file."""
+        if filename is None:
+            return
+        h = BasicStimuli._model_cache.pop(filename,None)
+        if h is not None:
+            self._base.loader.unloadModel(h)
+
     def uncache_movie(self,filename):
         """Un-cache a previously cached movie file."""
         if filename is None:
             return
         try:
-            h = self._base.loader.loadTexture(filename)
+            h = BasicStimuli._tex_cache.pop(filename,None)
+            if h is None:
+                h = self._base.loader.loadTexture(filename)
             self._base.loader.unloadTexture(h)
-        except:
+        except (OSError, AssertionError):
             pass
         try:
-            h = self._base.loader.loadSfx(filename)
+            h = BasicStimuli._sfx_cache.pop(filename,None)
+            if h is None:
+                h = self._base.loader.loadSfx(filename)
             self._base.loader.unloadSfx(h)
-        except:
+        except (OSError, AssertionError):
             pass
 
 
@@ -497,27 +506,160 @@ class BasicStimuli(LatentModule, ABC):
         """
         self.marker('Experiment Control/Setup/Parameters/%s:"%s"%s' % (self.__class__, str(self.__dict__).replace('"','\\"'), extra_msg))
 
-    def _destroy_object(self, obj, id=-1):
+    def _block_for(self, duration, obj, marker_id=-1):
+        """Internal helper to wait out the duration of a stimulus and then destroy it."""
+        if isinstance(duration, (list, tuple)):
+            self.sleep(duration[0])
+            self.waitfor(duration[1])
+            self._destroy_object(obj,marker_id)
+        elif isinstance(duration, str):
+            self.waitfor(duration)
+            self._destroy_object(obj,marker_id)
+        else:
+            self._schedule_destroy(obj,duration,marker_id)
+
+    def _schedule_destroy(self, obj, delay, marker_id=-1, block=True, name='ConvenienceFunctions, remove_stimulus'):
+        """
+        Internal helper to destroy a stimulus after a delay in seconds; either waits in the
+        current run() thread (block=True) or leaves it to a task on the Panda3d task manager.
+        """
+        if block:
+            self.sleep(delay)
+            self._destroy_object(obj,marker_id)
+        else:
+            self._base.taskMgr.doMethodLater(delay, self._destroy_object, name, extraArgs=[obj,marker_id])
+
+    def _destroy_object(self, obj, marker_id=-1):
         """Internal helper to automatically destroy a stimulus object."""
-        obj = list(obj) if isinstance(obj, tuple) else obj
-        obj = [obj] if not isinstance(obj, list) else obj
+        objs = obj if isinstance(obj, (list, tuple)) else (obj,)
 
-        try:
-            if id > 0 and self.implicit_markers:
-                self.marker(id)
-                
-            for ele in obj:
-                if ele is not None:
-                    if hasattr(ele,'destroy'):
-                        ele.destroy()
-                    elif hasattr(ele,'stop'):
-                        ele.stop()
-                    else:
-                        obj.remove(ele)
-                    # remove from cancel list
-                    self._to_destroy.remove(ele)
-        except:
-            warnings.warn("Error in destryoing objects")
+        if marker_id > 0 and self.implicit_markers:
+            self.marker(marker_id)
+
+        dispatch = BasicStimuli._destroy_dispatch
+        for ele in objs:
+            if ele is None:
+                continue
+            # take it off the cancel list first, so that a failure below cannot leave it there
+            self._to_destroy.pop(id(ele),None)
+            try:
+                fn = dispatch.get(type(ele))
+                if fn is None:
+                    fn = dispatch[type(ele)] = self._resolve_destroy(type(ele))
+                fn(ele)
+            except Exception as err:
+                warnings.warn("Error in destroying object {}: {}".format(ele, err))
+
+    @staticmethod
+    def _quads_geom(name, quads, color):
+        """
+        Internal helper to build a single transparent node of the given color from a list of
+        (x,z,half-width,half-height) rectangles, so that they are drawn in one batch.
+        """
+        vdata = pandac.GeomVertexData(name, pandac.GeomVertexFormat.getV3(), pandac.Geom.UHStatic)
+        vdata.setNumRows(4*len(quads))
+        vertex = pandac.GeomVertexWriter(vdata, 'vertex')
+        tris = pandac.GeomTriangles(pandac.Geom.UHStatic)
+        for i,(x,z,sx,sz) in enumerate(quads):
+            for dx,dz in ((-1,-1),(1,-1),(1,1),(-1,1)):
+                vertex.addData3(x+dx*sx, 0, z+dz*sz)
+            tris.addVertices(4*i, 4*i+1, 4*i+2)
+            tris.addVertices(4*i, 4*i+2, 4*i+3)
+        geom = pandac.Geom(vdata)
+        geom.addPrimitive(tris)
+        node = pandac.GeomNode(name)
+        node.addGeom(geom)
+        np = pandac.NodePath(node)
+        np.setColor(color)
+        np.setTransparency(_MALPHA)
+        # the half-extents may be negative (e.g. when top < bottom), which flips the winding
+        np.setTwoSided(True)
+        return np
+
+    @staticmethod
+    def _resolve_destroy(cls):
+        """Internal helper to look up how objects of a given type are torn down."""
+        if issubclass(cls, (OnscreenImage, OnscreenText)):
+            return BasicStimuli._release_object
+        fn = getattr(cls,'destroy',None) or getattr(cls,'stop',None)
+        return fn if fn is not None else (lambda ele: None)
+
+    def _acquire_image(self, image, pos=None, hpr=None, scale=None, color=None, parent=None):
+        """Internal helper to get a transparent OnscreenImage, recycled from the pool if possible."""
+        if not BasicStimuli._image_pool:
+            obj = OnscreenImage(image=image,pos=pos,hpr=hpr,scale=scale,color=color,parent=parent)
+            obj.setTransparency(_MALPHA)
+            obj._pool = BasicStimuli._image_pool
+            obj._pool_image = image
+            return obj
+        obj = BasicStimuli._image_pool.pop()
+        obj.reparentTo(parent if parent is not None else self._base.aspect2d)
+        if obj._pool_image != image:
+            # setImage() rebuilds the card under the current parent
+            obj.setImage(image)
+            obj.setTransparency(_MALPHA)
+            obj._pool_image = image
+        obj.setPos(pos if pos is not None else (0,0,0))
+        obj.setHpr(hpr if hpr is not None else (0,0,0))
+        obj.setScale(scale if scale is not None else 1)
+        if color is not None:
+            obj.setColor(color)
+        else:
+            obj.clearColor()
+        obj.show()
+        return obj
+
+    def _acquire_text(self, text, pos, roll, scale, fg, bg, shadow, shadow_offset, frame, align, wordwrap, draw_order, font, parent, sort):
+        """Internal helper to get an OnscreenText, recycled from the pool if possible."""
+        if not BasicStimuli._text_pool:
+            obj = OnscreenText(text=text,pos=pos,roll=roll,scale=scale,fg=fg,bg=bg,shadow=shadow,shadowOffset=shadow_offset,frame=frame,align=align,wordwrap=wordwrap,drawOrder=draw_order,font=font,parent=parent,sort=sort)
+            obj._pool = BasicStimuli._text_pool
+            return obj
+        obj = BasicStimuli._text_pool.pop()
+        obj.reparentTo(parent if parent is not None else self._base.aspect2d, sort)
+        obj.setFont(font)
+        obj.setAlign(align)
+        obj.setWordwrap(wordwrap)
+        obj.setFg(fg if fg is not None else (0,0,0,1))
+        obj.setBg(bg if bg is not None else (0,0,0,0))
+        obj.setShadow(shadow if shadow is not None else (0,0,0,0))
+        obj.setShadowOffset(shadow_offset)
+        obj.setFrame(frame if frame is not None else (0,0,0,0))
+        if draw_order is not None:
+            obj.textNode.setBin('fixed')
+            obj.textNode.setDrawOrder(draw_order)
+        else:
+            obj.textNode.clearBin()
+            obj.textNode.clearDrawOrder()
+        obj.setTextPos(pos)
+        obj.setTextR(roll)
+        obj.setTextScale(scale)
+        obj.setText(text)
+        obj.show()
+        return obj
+
+    @staticmethod
+    def _hand_out(obj):
+        """
+        Internal helper to take a node out of pooling before its handle is returned to the caller,
+        so that releasing it later destroys it rather than recycling a node the caller still holds.
+        """
+        obj._pool = None
+        return obj
+
+    @staticmethod
+    def _release_object(obj):
+        """Internal helper to hand a pooled stimulus node back for reuse instead of destroying it."""
+        if getattr(obj,'_pool',None) is None:
+            obj.destroy()
+            return
+        if getattr(obj,'_pool_image',None) is not None and obj._pool_image is not BasicStimuli._blank_tex:
+            # don't let the pool keep picture textures alive (e.g. after uncache_picture())
+            obj.clearTexture()
+            obj._pool_image = None
+        obj.hide()
+        obj.detachNode()
+        obj._pool.append(obj)
 
     # ======================
     # === Core Interface ===
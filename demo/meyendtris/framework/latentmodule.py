@@ -63,7 +63,7 @@ class LatentModule(
         
         self._subtasks = []             # optional list of any semi-parallel sub-tasks; tick and cancel are propagated down to them
         self._messages = []             # queue of messages to be sent off at the next tick
-        self._to_destroy = []           # list of objects to .destroy() upon cancel
+        self._to_destroy = {}           # objects to .destroy() upon cancel, keyed by id() in insertion order
 
     def launch(self,newtask,inherit_timing_parameters=True):
         """
@@ -178,6 +178,7 @@ class LatentModule(
             self._measuretime = time.time()
             # register an event handler
             self._received_dict = {eventid:[]}
+            self._event_index = {eventid:0}
             self._events_received = []
             self.accept(eventid,self._on_record_event,[eventid])
 
@@ -211,6 +212,7 @@ class LatentModule(
             for eventid in eventids:
                 self._received_dict[eventid] = [] 
                 self.accept(eventid,self._on_record_event,[eventid])
+            self._event_index = {e:i for i,e in enumerate(self._received_dict)}
 
             # call sleep
             if self.implicit_markers:
@@ -245,6 +247,7 @@ class LatentModule(
         for eventid in eventids:
             self._received_dict[eventid] = [] 
             self.accept(eventid,self._on_record_event,[eventid])
+        self._event_index = {e:i for i,e in enumerate(self._received_dict)}
         if self.implicit_markers:
             self.marker(228)
         return eventids
@@ -339,8 +342,7 @@ class LatentModule(
             meyendtris.framework.base_classes.shared_lock.release()
 
         # finally destroy all objects in self._to_destroy (in reverse order)
-        self._to_destroy.reverse()
-        for e in self._to_destroy:
+        for e in reversed(list(self._to_destroy.values())):
             try:
                 e.destroy()
             except Exception as err:
@@ -462,6 +464,5 @@ class LatentModule(
         Internal event handler for watchfor(_multiple).
         """
         self._received_dict[eventid].append(time.time()-self._measuretime)
-        idx = [i for i,x in enumerate(self._received_dict.keys()) if x == eventid]
-        self.marker(230+idx[0])
+        self.marker(230+self._event_index[eventid])
         self._events_received.append(eventid)